@@ -168,6 +168,7 @@ setup(
         "tests": [
             "pytest>=7.1.3",
             "pytest-mpl==0.17.0",
+            "pytest-xdist",
         ],
         "docs": [
             "sphinx",
@@ -49,6 +49,17 @@ def _format_distortion_directory_name(
     )
 
 
+def _is_defect_folder_name(name: str) -> bool:
+    """
+    Check if ``name`` is recognised as a defect folder name by
+    ``format_defect_name``.
+    """
+    try:
+        return format_defect_name(name, include_site_info_in_name=False) is not None
+    except ValueError:  # defect folder name not recognised
+        return False
+
+
 def read_defects_directories(output_path: str = "./") -> dict:
     """
     Reads all defect folders in the ``output_path`` directory and stores defect
@@ -63,14 +74,10 @@ def read_defects_directories(output_path: str = "./") -> dict:
         :obj:`dict`:
             Dictionary mapping defect names to a list of its charge states.
     """
-    list_subdirectories = list(next(os.walk(output_path))[1])  # Only subdirectories in current directory
-    for i in list_subdirectories.copy():  # make copy of list for iterating over and removing elements
-        try:
-            formatted_name = format_defect_name(i, include_site_info_in_name=False)
-            if formatted_name is None:  # defect folder name not recognised, remove from list
-                list_subdirectories.remove(i)
-        except ValueError:  # defect folder name not recognised, remove from list
-            list_subdirectories.remove(i)
+    with os.scandir(output_path) as entries:  # only (defect) subdirectories in output_path
+        list_subdirectories = [
+            entry.name for entry in entries if entry.is_dir() and _is_defect_folder_name(entry.name)
+        ]
 
     list_name_charge = [
         i.rsplit("_", 1) for i in list_subdirectories
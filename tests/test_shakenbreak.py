@@ -1,17 +1,24 @@
 import copy
+import errno
+import functools
+import json
 import os
 import shutil
+import tempfile
 import unittest
 import warnings
 from unittest.mock import Mock, patch
 
+import matplotlib.pyplot as plt
 import pytest
+from monty.json import MontyDecoder
 from monty.serialization import dumpfn, loadfn
 from pymatgen.core.structure import Structure
 from pymatgen.io.vasp.inputs import UnknownPotcarWarning
 
 from shakenbreak import energy_lowering_distortions, input, io, plotting
 from test_energy_lowering_distortions import assert_not_called_with
+from test_input import assert_print_calls
 from test_plotting import custom_mpl_image_compare
 
 Mock.assert_not_called_with = assert_not_called_with
@@ -27,79 +34,122 @@ def if_present_rm(path):
             shutil.rmtree(path)
 
 
-class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
-    def setUp(self):
-        warnings.simplefilter("ignore", UnknownPotcarWarning)
-        self.DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
-        self.VASP_CDTE_DATA_DIR = os.path.join(self.DATA_DIR, "vasp/CdTe")
-        # Refactor doped defect dict to dict of Defect() objects
-        self.cdte_doped_defect_dict = loadfn(
-            os.path.join(self.VASP_CDTE_DATA_DIR, "CdTe_defects_dict.json")
-        )
+@functools.lru_cache(maxsize=None)
+def _read_ref_structure(path):
+    """
+    Parse a reference test data structure file, caching the parsed ``Structure``
+    (so should be copied before being modified).
+    """
+    return Structure.from_file(path)
+
+
+def _stage(src, dst):
+    """
+    Hardlink the test data file ``src`` to ``dst`` (falling back to copying if
+    hardlinks can't be made here, e.g. across filesystems). Only for files which
+    are read but never written to in the tests, as writing to a hardlink would
+    modify the test data file.
+    """
+    try:
+        os.link(src, dst)
+    except OSError as exc:
+        if exc.errno not in {errno.EXDEV, errno.EPERM, errno.EMLINK}:
+            raise  # e.g. FileExistsError, where copying could write through an existing hardlink
+        shutil.copyfile(src, dst)
+
+
+def _stage_tree(src, dst):
+    """
+    Recreate the test data directory tree ``src`` at ``dst``, with its files staged
+    using ``_stage``. Directories are created rather than symlinked, so that files
+    newly written into the tree (e.g. by ``write_retest_inputs``) do not end up in
+    the test data, but the existing files in ``src`` must not be rewritten.
+    """
+    shutil.copytree(src, dst, copy_function=_stage)
 
-        self.V_Cd_dict = self.cdte_doped_defect_dict["vacancies"][0]
-
-        self.V_Cd = input.generate_defect_object(
-            self.V_Cd_dict, self.cdte_doped_defect_dict["bulk"]
-        )
-        self.V_Cd_minus_0pt55_structure = Structure.from_file(
-            f"{self.VASP_CDTE_DATA_DIR}/vac_1_Cd_0/Bond_Distortion_-55.0%/CONTCAR"
-        )
-
-        # create fake distortion folders for testing functionality:
-        for defect_dir in ["vac_1_Cd_-1", "vac_1_Cd_-2"]:
-            if_present_rm(defect_dir)
-            os.mkdir(f"{defect_dir}")
 
+class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
+    @classmethod
+    def setUpClass(cls):
+        # load (read-only) test data once for all tests:
+        cls.DATA_DIR = os.path.join(os.path.dirname(__file__), "data")
+        cls.VASP_CDTE_DATA_DIR = os.path.join(cls.DATA_DIR, "vasp/CdTe")
+        # only decode the (doped) defect dict entries used in these tests, rather than
+        # reconstructing all structures in the file with ``loadfn``:
+        with open(os.path.join(cls.VASP_CDTE_DATA_DIR, "CdTe_defects_dict.json")) as f:
+            raw_cdte_doped_defect_dict = json.load(f)
+
+        cls.V_Cd_dict = MontyDecoder().process_decoded(
+            raw_cdte_doped_defect_dict["vacancies"][0]
+        )
+
+        cls.V_Cd = input.generate_defect_object(
+            cls.V_Cd_dict,
+            MontyDecoder().process_decoded(raw_cdte_doped_defect_dict["bulk"]),
+        )  # only shallow copies with new ``user_charges`` are modified in tests
+        cls.V_Cd_minus_0pt55_structure = _read_ref_structure(
+            f"{cls.VASP_CDTE_DATA_DIR}/vac_1_Cd_0/Bond_Distortion_-55.0%/CONTCAR"
+        )
+
+        # fake energies files (the parsing functions only read ``{defect}/{defect}.yaml``),
+        # serialised once and copied into each test directory in ``setUp``:
+        cls._fake_energies_tmp = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(cls._fake_energies_tmp.cleanup)
+        cls.FAKE_ENERGIES_FILES = {
+            "vac_1_Cd_-1": os.path.join(cls._fake_energies_tmp.name, "vac_1_Cd_-1.yaml"),
+            "vac_1_Cd_-2": os.path.join(cls._fake_energies_tmp.name, "vac_1_Cd_-2.yaml"),
+        }
         V_Cd_1_dict = {"distortions": {-0.075: -206.700}, "Unperturbed": -205.8}
-        dumpfn(V_Cd_1_dict, "vac_1_Cd_-1/vac_1_Cd_-1.yaml")
+        dumpfn(V_Cd_1_dict, cls.FAKE_ENERGIES_FILES["vac_1_Cd_-1"])
         V_Cd_2_dict = {"distortions": {-0.35: -205.7}, "Unperturbed": -205.8}
-        dumpfn(V_Cd_2_dict, "vac_1_Cd_-2/vac_1_Cd_-2.yaml")
+        dumpfn(V_Cd_2_dict, cls.FAKE_ENERGIES_FILES["vac_1_Cd_-2"])
 
-        # create fake structures for testing functionality:
-        for fake_dir in ["Bond_Distortion_-7.5%", "Unperturbed"]:
-            if_present_rm(f"vac_1_Cd_-1/{fake_dir}")
-            os.mkdir(f"vac_1_Cd_-1/{fake_dir}")
-            shutil.copyfile(
-                os.path.join(self.VASP_CDTE_DATA_DIR, "CdTe_V_Cd_-1_vgam_POSCAR"),
-                f"vac_1_Cd_-1/{fake_dir}/CONTCAR",
-            )
+        # parse and plot the fake vac_1_Cd_-2/-1/0 energies once, for the plotting tests:
+        cls._parse_and_plot_fake_vac_1_Cd()
 
-        for fake_dir in ["Bond_Distortion_-35.0%", "Unperturbed"]:
-            if_present_rm(f"vac_1_Cd_-2/{fake_dir}")
-            os.mkdir(f"vac_1_Cd_-2/{fake_dir}")
-            shutil.copyfile(
-                os.path.join(self.VASP_CDTE_DATA_DIR, "CdTe_V_Cd_POSCAR"),
-                f"vac_1_Cd_-2/{fake_dir}/CONTCAR",
+    def setUp(self):
+        warnings.simplefilter("ignore", UnknownPotcarWarning)
+        # run each test in its own temporary directory, so test-generated files are isolated and
+        # removed in one go (cleanups run even if setUp or the test fails):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        # release any figures generated in the test (but not the shared class figures):
+        self.addCleanup(self._close_new_figures, set(plt.get_fignums()))
+        os.chdir(self._tmp.name)
+
+        # create fake distortion folders for testing functionality:
+        for defect_dir, energies_file in self.FAKE_ENERGIES_FILES.items():
+            os.makedirs(defect_dir, exist_ok=True)
+            shutil.copyfile(  # copied (not hardlinked), as energies files are rewritten in tests
+                energies_file, f"{defect_dir}/{defect_dir}.yaml"
             )
 
+        # create fake structures for testing functionality:
+        for defect_dir, fake_dirs, contcar in [
+            ("vac_1_Cd_-1", ["Bond_Distortion_-7.5%", "Unperturbed"], "CdTe_V_Cd_-1_vgam_POSCAR"),
+            ("vac_1_Cd_-2", ["Bond_Distortion_-35.0%", "Unperturbed"], "CdTe_V_Cd_POSCAR"),
+        ]:
+            for fake_dir in fake_dirs:
+                os.makedirs(f"{defect_dir}/{fake_dir}", exist_ok=True)
+                _stage(
+                    os.path.join(self.VASP_CDTE_DATA_DIR, contcar),
+                    f"{defect_dir}/{fake_dir}/CONTCAR",
+                )
+
         for charge in [-1, -2]:
-            shutil.copyfile(
+            shutil.copyfile(  # copied (not hardlinked), as POSCARs are rewritten in tests
                 os.path.join(self.VASP_CDTE_DATA_DIR, "CdTe_V_Cd_POSCAR"),
                 f"vac_1_Cd_{charge}/Unperturbed/POSCAR",
             )  # so when we generate SnB files in `test_SnB_integration` it recognises it as
             # being the same defect
 
-        self.defect_charges_dict = (
-            energy_lowering_distortions.read_defects_directories()
-        )
-        self.defect_charges_dict.pop("vac_1_Ti", None)  # Used for magnetization tests
-        self.defect_charges_dict.pop("v_O_s1", None)  # Used for magnetization tests
-
-    def tearDown(self):
-        for i in os.listdir():
-            if "vac_1_Cd" in i:
-                if_present_rm(i)
-        if_present_rm("distortion_metadata.json")
-        if_present_rm("parsed_defects_dict.json")
-
     def write_retest_inputs_and_check_print_calls(
-        self, low_energy_defects, mock_print, print_call_1, print_call_2
+        self, low_energy_defects, mock_print, *messages
     ):
         energy_lowering_distortions.write_retest_inputs(low_energy_defects)
 
-        mock_print.assert_any_call(print_call_1)
-        mock_print.assert_any_call(print_call_2)
+        assert_print_calls(mock_print, [(message,) for message in messages])
 
 
     def test_SnB_integration(self):
@@ -126,13 +176,11 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
             verbose=False,
         )
         shutil.rmtree("vac_1_Cd_0")
-        shutil.copytree(
+        _stage_tree(
             os.path.join(self.VASP_CDTE_DATA_DIR, "vac_1_Cd_0"), "vac_1_Cd_0"
         )  # overwrite
 
         defect_charges_dict = energy_lowering_distortions.read_defects_directories()
-        defect_charges_dict.pop("vac_1_Ti", None)  # Used for magnetization tests
-        defect_charges_dict.pop("v_O_s1", None)  # Used for magnetization tests
 
         low_energy_defects = (
             energy_lowering_distortions.get_energy_lowering_distortions(
@@ -161,12 +209,8 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
                 mock_print,
                 "Writing low-energy distorted structure to ./vac_1_Cd_-2/Bond_Distortion_-55.0%_from_0",
                 "Writing low-energy distorted structure to ./vac_1_Cd_-1/Bond_Distortion_-55.0%_from_0",
-            )
-            mock_print.assert_any_call(
-                "Writing low-energy distorted structure to ./vac_1_Cd_0/Bond_Distortion_-7.5%_from_-1"
-            )
-            mock_print.assert_any_call(
-                "Writing low-energy distorted structure to ./vac_1_Cd_-2/Bond_Distortion_-7.5%_from_-1"
+                "Writing low-energy distorted structure to ./vac_1_Cd_0/Bond_Distortion_-7.5%_from_-1",
+                "Writing low-energy distorted structure to ./vac_1_Cd_-2/Bond_Distortion_-7.5%_from_-1",
             )
 
         # test correct structures written
@@ -183,7 +227,7 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
         )
         gen_struc.remove_oxidation_states()
         self.assertEqual(
-            Structure.from_file(
+            _read_ref_structure(
                 os.path.join(self.VASP_CDTE_DATA_DIR, "CdTe_V_Cd_-1_vgam_POSCAR")
             ),
             gen_struc,
@@ -208,17 +252,17 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
         # note we're not updating vac_1_Cd_0.yaml here, to test the info message that the
         # Bond_Distortion_-7.5%_from_-1 folder is already present in this directory
 
-        shutil.copyfile(
+        _stage(
             os.path.join(
                 self.VASP_CDTE_DATA_DIR, "vac_1_Cd_0/Bond_Distortion_-55.0%/CONTCAR"
             ),
             "vac_1_Cd_-1/Bond_Distortion_-55.0%_from_0/CONTCAR",
         )
-        shutil.copyfile(
+        _stage(
             os.path.join(self.VASP_CDTE_DATA_DIR, "CdTe_V_Cd_-1_vgam_POSCAR"),
             "vac_1_Cd_-2/Bond_Distortion_-7.5%_from_-1/CONTCAR",
         )
-        shutil.copyfile(
+        _stage(
             os.path.join(self.VASP_CDTE_DATA_DIR, "CdTe_V_Cd_-1_vgam_POSCAR"),
             "vac_1_Cd_0/Bond_Distortion_-7.5%_from_-1/CONTCAR",
         )
@@ -229,16 +273,19 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
                     defect_charges_dict
                 )
             )
-        mock_print.assert_any_call(
-            "vac_1_Cd_0: Energy difference between minimum, found with -0.55 bond distortion, "
-            "and unperturbed: -0.76 eV."
+        assert_print_calls(
+            mock_print,
+            [
+                (
+                    "vac_1_Cd_0: Energy difference between minimum, found with -0.55 bond distortion, "
+                    "and unperturbed: -0.76 eV.",
+                ),
+                ("\nComparing and pruning defect structures across charge states...",),
+            ],
         )
         mock_print.assert_not_called_with(
             "Comparing structures to specified ref_structure (Cd31 Te32)..."
         )
-        mock_print.assert_any_call(
-            "\nComparing and pruning defect structures across charge states..."
-        )
         try:
             mock_print.assert_any_call(
                 "Low-energy distorted structure for vac_1_Cd_-1 already found with charge states ['0'], "
@@ -306,7 +353,7 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
             verbose=False,
         )
         shutil.rmtree("vac_1_Cd_0")
-        shutil.copytree(
+        _stage_tree(
             os.path.join(self.VASP_CDTE_DATA_DIR, "vac_1_Cd_0"), "vac_1_Cd_0"
         )  # overwrite
         for charge in [-1, -2]:
@@ -320,8 +367,6 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
             )
 
         defect_charges_dict = energy_lowering_distortions.read_defects_directories()
-        defect_charges_dict.pop("vac_1_Ti", None)  # Used for magnetization tests
-        defect_charges_dict.pop("v_O_s1", None)  # Used for magnetization tests
 
         low_energy_defects = (
             energy_lowering_distortions.get_energy_lowering_distortions(
@@ -350,12 +395,8 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
                 mock_print,
                 "Writing low-energy distorted structure to ./vac_1_Cd_2/Bond_Distortion_-55.0%_from_0",
                 "Writing low-energy distorted structure to ./vac_1_Cd_1/Bond_Distortion_-55.0%_from_0",
-            )
-            mock_print.assert_any_call(
-                "Writing low-energy distorted structure to ./vac_1_Cd_0/Bond_Distortion_-7.5%_from_+1"
-            )
-            mock_print.assert_any_call(
-                "Writing low-energy distorted structure to ./vac_1_Cd_2/Bond_Distortion_-7.5%_from_+1"
+                "Writing low-energy distorted structure to ./vac_1_Cd_0/Bond_Distortion_-7.5%_from_+1",
+                "Writing low-energy distorted structure to ./vac_1_Cd_2/Bond_Distortion_-7.5%_from_+1",
             )
 
         # test correct structures written
@@ -372,7 +413,7 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
         )
         gen_struc.remove_oxidation_states()
         self.assertEqual(
-            Structure.from_file(
+            _read_ref_structure(
                 os.path.join(self.VASP_CDTE_DATA_DIR, "CdTe_V_Cd_-1_vgam_POSCAR")
             ),
             gen_struc,
@@ -397,17 +438,17 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
         # note we're not updating vac_1_Cd_0.yaml here, to test the info message that the
         # Bond_Distortion_-7.5%_from_-1 folder is already present in this directory
 
-        shutil.copyfile(
+        _stage(
             os.path.join(
                 self.VASP_CDTE_DATA_DIR, "vac_1_Cd_0/Bond_Distortion_-55.0%/CONTCAR"
             ),
             "vac_1_Cd_1/Bond_Distortion_-55.0%_from_0/CONTCAR",
         )
-        shutil.copyfile(
+        _stage(
             os.path.join(self.VASP_CDTE_DATA_DIR, "CdTe_V_Cd_-1_vgam_POSCAR"),
             "vac_1_Cd_2/Bond_Distortion_-7.5%_from_+1/CONTCAR",
         )
-        shutil.copyfile(
+        _stage(
             os.path.join(self.VASP_CDTE_DATA_DIR, "CdTe_V_Cd_-1_vgam_POSCAR"),
             "vac_1_Cd_0/Bond_Distortion_-7.5%_from_+1/CONTCAR",
         )
@@ -418,16 +459,19 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
                     defect_charges_dict
                 )
             )
-        mock_print.assert_any_call(
-            "vac_1_Cd_0: Energy difference between minimum, found with -0.55 bond distortion, "
-            "and unperturbed: -0.76 eV."
+        assert_print_calls(
+            mock_print,
+            [
+                (
+                    "vac_1_Cd_0: Energy difference between minimum, found with -0.55 bond distortion, "
+                    "and unperturbed: -0.76 eV.",
+                ),
+                ("\nComparing and pruning defect structures across charge states...",),
+            ],
         )
         mock_print.assert_not_called_with(
             "Comparing structures to specified ref_structure (Cd31 Te32)..."
         )
-        mock_print.assert_any_call(
-            "\nComparing and pruning defect structures across charge states..."
-        )
         try:
             mock_print.assert_any_call(
                 "Low-energy distorted structure for vac_1_Cd_1 already found with charge states ['0'], "
@@ -477,15 +521,18 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
 
     # Now we test parsing of final energies and plotting
 
-
-    def write_example_OUTCARs(self, defect_dir):
-        for dist, energy in {  # Fake energies
-            "Bond_Distortion_-35.0%": -205.7,
-            "Bond_Distortion_-77.0%_High_Energy": 1000.0,  # positive energy
-            "Bond_Distortion_-50.0%_from_0": -206.5,
-            "Bond_Distortion_0.0%": -205.6,
-            "Unperturbed": -205.4,
-        }.items():
+    @staticmethod
+    def write_example_OUTCARs(defect_dir, energies=None):
+        for dist, energy in (
+            energies
+            or {  # Fake energies
+                "Bond_Distortion_-35.0%": -205.7,
+                "Bond_Distortion_-77.0%_High_Energy": 1000.0,  # positive energy
+                "Bond_Distortion_-50.0%_from_0": -206.5,
+                "Bond_Distortion_0.0%": -205.6,
+                "Unperturbed": -205.4,
+            }
+        ).items():
             # Just using relevant part of the OUTCAR file to quickly test parsing
             # as parsing of the full file has been extensively tested in test_cli.py
             outcar = f"""
@@ -518,15 +565,70 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
         self.assertFalse(-0.77 in energies["distortions"])
 
         defect_charges_dict = energy_lowering_distortions.read_defects_directories()
-        defect_charges_dict.pop("vac_1_Ti", None)  # Used for magnetization tests
-        defect_charges_dict.pop("v_O_s1", None)  # Used for magnetization tests
 
         fig_dict = plotting.plot_all_defects(defect_charges_dict, save_format="png")
         return fig_dict[defect_dir]
 
+    @staticmethod
+    def _close_new_figures(fignums):
+        for fignum in set(plt.get_fignums()) - fignums:
+            plt.close(fignum)
+
+    @classmethod
+    def _parse_and_plot_fake_vac_1_Cd(cls):
+        """
+        Write and parse fake energies for ``vac_1_Cd_-2``, ``vac_1_Cd_-1`` and
+        ``vac_1_Cd_0`` in a temporary directory, and plot all three with a single
+        ``plot_all_defects`` call (each figure only depends on the energies of its
+        own charge state). Stores the energies files and figures as class
+        attributes, which are removed/closed in the class cleanup.
+        """
+        tmp_dir = tempfile.TemporaryDirectory()
+        cls.addClassCleanup(tmp_dir.cleanup)
+
+        cls.FAKE_VAC_1_CD_ENERGIES_FILES = {}
+        for defect_dir, energies in {
+            "vac_1_Cd_-2": None,  # default fake energies
+            "vac_1_Cd_-1": {
+                "Bond_Distortion_-35.0%": -205.7,
+                "Bond_Distortion_0.0%": -205.6,
+                "Unperturbed": -205.4,
+                "Bond_Distortion_-50.0%_from_0": -206.5,
+                "Bond_Distortion_-20.0%_from_-1": -206.5,
+            },
+            "vac_1_Cd_0": {
+                "Bond_Distortion_-40.0%": -205.7,
+                "Bond_Distortion_-20.0%": -206.7,
+                "Bond_Distortion_0.0%": -205.6,
+                "Bond_Distortion_20.0%": -206.7,
+                "Bond_Distortion_40.0%": -206.7,
+                "Bond_Distortion_-50.0%_from_0": -206.5,
+                "Unperturbed": -205.4,
+            },
+        }.items():
+            os.mkdir(f"{tmp_dir.name}/{defect_dir}")
+            cls.write_example_OUTCARs(f"{tmp_dir.name}/{defect_dir}", energies)
+            # Parse final energies from OUTCAR files and write them to yaml files
+            cls.FAKE_VAC_1_CD_ENERGIES_FILES[defect_dir] = io.parse_energies(
+                defect=defect_dir, path=tmp_dir.name
+            )
+
+        defect_charges_dict = energy_lowering_distortions.read_defects_directories(
+            output_path=tmp_dir.name
+        )
+        cls.fake_vac_1_Cd_fig_dict = plotting.plot_all_defects(
+            defect_charges_dict, output_path=tmp_dir.name, save_format="png"
+        )
+        for fig in cls.fake_vac_1_Cd_fig_dict.values():
+            cls.addClassCleanup(plt.close, fig)
+
     @custom_mpl_image_compare("vac_1_Cd_-2.png")
     def test_plot_fake_vac_1_Cd_m2(self):
-        return self.parse_and_generate_defect_plot("vac_1_Cd_-2")
+        self.assertTrue(os.path.exists(self.FAKE_VAC_1_CD_ENERGIES_FILES["vac_1_Cd_-2"]))
+        energies = loadfn(self.FAKE_VAC_1_CD_ENERGIES_FILES["vac_1_Cd_-2"])
+        self.assertTrue(-0.35 in energies["distortions"])
+        self.assertFalse(-0.77 in energies["distortions"])
+        return self.fake_vac_1_Cd_fig_dict["vac_1_Cd_-2"]
 
     @pytest.mark.mpl_image_compare(
         baseline_dir="data/remote_baseline_plots",
@@ -550,85 +652,13 @@ class ShakeNBreakTestCase(unittest.TestCase):  # integration testing ShakeNBreak
 
     @custom_mpl_image_compare("vac_1_Cd_-1.png")
     def test_plot_fake_vac_1_Cd_m1(self):
-        defect_dir = "vac_1_Cd_-1"
-        if_present_rm(defect_dir)
-        os.mkdir(defect_dir)
-        for dist, energy in {  # Fake energies
-            "Bond_Distortion_-35.0%": -205.7,
-            "Bond_Distortion_0.0%": -205.6,
-            "Unperturbed": -205.4,
-            "Bond_Distortion_-50.0%_from_0": -206.5,
-            "Bond_Distortion_-20.0%_from_-1": -206.5,
-        }.items():
-            # Just using relevant part of the OUTCAR file to quickly test parsing
-            # as parsing of the full file has been extensively tested in test_cli.py
-            outcar = f"""
-            reached required accuracy - stopping structural energy minimisation
-            FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)
-            ---------------------------------------------------
-            free  energy   TOTEN  =     -1173.02056574 eV
-
-            energy  without entropy=    -1173.02056574  energy(sigma->0) =    {energy}
-
-            d Force = 0.4804267E-04[ 0.582E-05, 0.903E-04]  d Energy = 0.2446833E-04 0.236E-04
-            d Force =-0.1081853E+01[-0.108E+01,-0.108E+01]  d Ewald  =-0.1081855E+01 0.235E-05
-            """
-            os.mkdir(f"{defect_dir}/{dist}")
-            with open(f"{defect_dir}/{dist}/OUTCAR", "w") as f:
-                f.write(outcar)
-
-        # Parse final energies from OUTCAR files and write them to yaml files
-        energies_file = io.parse_energies(defect=defect_dir, path="./")
-        self.assertTrue(os.path.exists(energies_file))
-
-        defect_charges_dict = energy_lowering_distortions.read_defects_directories()
-        defect_charges_dict.pop("vac_1_Ti", None)  # Used for magnetization tests
-        defect_charges_dict.pop("v_O_s1", None)  # Used for magnetization tests
-
-        fig_dict = plotting.plot_all_defects(defect_charges_dict, save_format="png")
-        return fig_dict["vac_1_Cd_-1"]
+        self.assertTrue(os.path.exists(self.FAKE_VAC_1_CD_ENERGIES_FILES["vac_1_Cd_-1"]))
+        return self.fake_vac_1_Cd_fig_dict["vac_1_Cd_-1"]
 
     @custom_mpl_image_compare("vac_1_Cd_0.png")
     def test_plot_fake_vac_1_Cd_0(self):
-        defect_dir = "vac_1_Cd_0"
-        if_present_rm(defect_dir)
-        os.mkdir(defect_dir)
-        for dist, energy in {  # fake energies
-            "Bond_Distortion_-40.0%": -205.7,
-            "Bond_Distortion_-20.0%": -206.7,
-            "Bond_Distortion_0.0%": -205.6,
-            "Bond_Distortion_20.0%": -206.7,
-            "Bond_Distortion_40.0%": -206.7,
-            "Bond_Distortion_-50.0%_from_0": -206.5,
-            "Unperturbed": -205.4,
-        }.items():
-            # Just using relevant part of the OUTCAR file to quickly test parsing
-            # as parsing of the full file has been extensively tested in test_cli.py
-            outcar = f"""
-            reached required accuracy - stopping structural energy minimisation
-            FREE ENERGIE OF THE ION-ELECTRON SYSTEM (eV)
-            ---------------------------------------------------
-            free  energy   TOTEN  =     -1173.02056574 eV
-
-            energy  without entropy=    -1173.02056574  energy(sigma->0) =    {energy}
-
-            d Force = 0.4804267E-04[ 0.582E-05, 0.903E-04]  d Energy = 0.2446833E-04 0.236E-04
-            d Force =-0.1081853E+01[-0.108E+01,-0.108E+01]  d Ewald  =-0.1081855E+01 0.235E-05
-            """
-            os.mkdir(f"{defect_dir}/{dist}")
-            with open(f"{defect_dir}/{dist}/OUTCAR", "w") as f:
-                f.write(outcar)
-
-        # Parse final energies from OUTCAR files and write them to yaml files
-        _energies_file = io.parse_energies(defect=defect_dir, path="./")
-        self.assertTrue(os.path.exists(f"{defect_dir}/{defect_dir}.yaml"))
-
-        defect_charges_dict = energy_lowering_distortions.read_defects_directories()
-        defect_charges_dict.pop("vac_1_Ti", None)  # Used for magnetization tests
-        defect_charges_dict.pop("v_O_s1", None)  # Used for magnetization tests
-
-        fig_dict = plotting.plot_all_defects(defect_charges_dict, save_format="png")
-        return fig_dict["vac_1_Cd_0"]
+        self.assertTrue(os.path.exists(self.FAKE_VAC_1_CD_ENERGIES_FILES["vac_1_Cd_0"]))
+        return self.fake_vac_1_Cd_fig_dict["vac_1_Cd_0"]
 
 
 if __name__ == "__main__":